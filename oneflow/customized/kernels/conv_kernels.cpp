@@ -432,9 +432,9 @@ class ConvCpuKernel final : public user_op::OpKernel {
       const user_op::Tensor* bias = ctx->Tensor4ArgNameAndIndex("bias", 0);
       if (bias != nullptr) {
         int64_t num_of_col_buf = CalcElemNumOfColBuf(out->shape(), weight->shape(), idx_offset);
-        int64_t num_of_bias_mul = tmp_buffer->shape().elem_cnt() - num_of_col_buf;
+        int64_t num_of_bias_mul = conv_state->out_5d_shape_.Count(idx_offset, idx_offset + 3);
         CHECK_GT(num_of_bias_mul, 0);
-        T* bias_mul_dptr = col_buf_dptr + num_of_col_buf * sizeof(T);
+        T* bias_mul_dptr = col_buf_dptr + num_of_col_buf;
         if (!is_bias_mul_inited) {
           InitBiasMulBuf(bias_mul_dptr, num_of_bias_mul);
           is_bias_mul_inited = true;
@@ -637,7 +637,6 @@ class ConvBiasGradCpuKernel final : public user_op::OpKernel {
     user_op::Tensor* bias_diff = ctx->Tensor4ArgNameAndIndex("bias_diff", 0);
     user_op::Tensor* bias_mul_buf = ctx->Tensor4ArgNameAndIndex("tmp_buffer", 0);
 
-    InitBiasMulBuf(bias_mul_buf->mut_dptr<T>(), bias_mul_buf->shape().elem_cnt());
     Memset<DeviceType::kCPU>(ctx->device_ctx(), bias_diff->mut_dptr<T>(), 0,
                              bias_diff->shape().elem_cnt() * sizeof(T));
 
@@ -655,16 +654,19 @@ class ConvBiasGradCpuKernel final : public user_op::OpKernel {
       filter = dy->shape().At(dy->shape().NumAxes() - 1);
     }
     int ndims = dy->shape().NumAxes() - 2;
+    // tmp_buffer is sized in bytes, so fill only the od * oh * ow elements the gemm reads
+    const int64_t num_of_bias_mul = dy->shape().Count(idx_offset, idx_offset + ndims);
+    InitBiasMulBuf(bias_mul_buf->mut_dptr<T>(), num_of_bias_mul);
     FOR_RANGE(int64_t, i, 0, dy->shape().At(0)) {
       // channels first:  bias' += out' * bias_mul
       // channels last:   bias' += out'(T) * bias_mul
-      NewKernelUtil<DeviceType::kCPU>::OFGemm(
-          nullptr, is_out_diff_need_trans, CblasNoTrans,
-          filter,                                             //  filter
-          1,                                                  //  1
-          dy->shape().Count(idx_offset, idx_offset + ndims),  //  od * oh * ow
-          static_cast<T>(1), GetImgDptr<T>(dy, i), bias_mul_buf->dptr<T>(), static_cast<T>(1),
-          bias_diff->mut_dptr<T>());
+      NewKernelUtil<DeviceType::kCPU>::OFGemm(nullptr, is_out_diff_need_trans, CblasNoTrans,
+                                              filter,           //  filter
+                                              1,                //  1
+                                              num_of_bias_mul,  //  od * oh * ow
+                                              static_cast<T>(1), GetImgDptr<T>(dy, i),
+                                              bias_mul_buf->dptr<T>(), static_cast<T>(1),
+                                              bias_diff->mut_dptr<T>());
     }
   }
 };
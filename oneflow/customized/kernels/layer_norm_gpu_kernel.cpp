@@ -206,8 +206,8 @@ class LayerNormParamGradGpuKernel final : public user_op::OpKernel {
     const bool has_gamma_diff = gamma_diff != nullptr;
     const bool has_normalized_diff = normalized_diff != nullptr;
     const bool has_gamma = gamma != nullptr;
+    user_op::Tensor* reduce_buf = ctx->Tensor4ArgNameAndIndex("tmp_buffer", 0);
     if (has_beta_diff) {
-      user_op::Tensor* reduce_buf = ctx->Tensor4ArgNameAndIndex("reduce_buf", 0);
       const int64_t m = beta_diff->shape().elem_cnt();
       CHECK_EQ(dy->shape().elem_cnt() % m, 0);
       const int64_t n = dy->shape().elem_cnt() / m;
@@ -216,7 +216,6 @@ class LayerNormParamGradGpuKernel final : public user_op::OpKernel {
     }
     if (has_gamma_diff) {
       const user_op::Tensor* normalized = ctx->Tensor4ArgNameAndIndex("normalized", 0);
-      user_op::Tensor* reduce_buf = ctx->Tensor4ArgNameAndIndex("reduce_buf", 0);
       const int64_t m = gamma_diff->shape().elem_cnt();
       CHECK_EQ(dy->shape().elem_cnt() % m, 0);
       const int64_t n = dy->shape().elem_cnt() / m;
@@ -241,11 +240,19 @@ class LayerNormParamGradGpuKernel final : public user_op::OpKernel {
   };
 };
 
-#define REGISTER_LAYER_NORM_PARAM_GRAD_GPU_KERNEL(dtype)              \
-  REGISTER_USER_KERNEL("layer_norm_param_grad")                       \
-      .SetCreateFn<LayerNormParamGradGpuKernel<dtype>>()              \
-      .SetIsMatchedHob((user_op::HobDeviceType() == DeviceType::kGPU) \
-                       & (user_op::HobDataType("dy", 0) == GetDataType<dtype>::value));
+#define REGISTER_LAYER_NORM_PARAM_GRAD_GPU_KERNEL(dtype)                                        \
+  REGISTER_USER_KERNEL("layer_norm_param_grad")                                                 \
+      .SetCreateFn<LayerNormParamGradGpuKernel<dtype>>()                                        \
+      .SetIsMatchedHob((user_op::HobDeviceType() == DeviceType::kGPU)                           \
+                       & (user_op::HobDataType("dy", 0) == GetDataType<dtype>::value))          \
+      .SetInferTmpSizeFn([](oneflow::user_op::InferContext* ctx) {                              \
+        if (ctx->TensorDesc4ArgNameAndIndex("beta_diff", 0) == nullptr                          \
+            && ctx->TensorDesc4ArgNameAndIndex("gamma_diff", 0) == nullptr) {                   \
+          return static_cast<size_t>(0);                                                        \
+        }                                                                                       \
+        const user_op::TensorDesc* dy = ctx->TensorDesc4ArgNameAndIndex("dy", 0);               \
+        return GetCudaAlignedSize(dy->shape().elem_cnt() * GetSizeOfDataType(dy->data_type())); \
+      });
 
 REGISTER_LAYER_NORM_PARAM_GRAD_GPU_KERNEL(float)
 REGISTER_LAYER_NORM_PARAM_GRAD_GPU_KERNEL(double)
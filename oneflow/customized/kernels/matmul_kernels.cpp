@@ -17,6 +17,8 @@ limitations under the License.
 #include "oneflow/core/kernel/new_kernel_util.h"
 #include "oneflow/core/framework/config_def.h"
 #include "oneflow/core/job/job_desc.h"
+#include "oneflow/core/ndarray/ndarray_util.h"
+#include "oneflow/core/ndarray/xpu_var_ndarray.h"
 
 namespace oneflow {
 
@@ -31,6 +33,18 @@ std::tuple<int32_t, int32_t, int32_t> CalcMNK(const ShapeView& a_shape, const Sh
   return std::make_tuple(m, n, k);
 }
 
+// fills out with the optional bias so that the gemm can accumulate onto it with beta = 1
+template<DeviceType device_type, typename T>
+bool InitOutWithBias(user_op::KernelComputeContext* ctx, int32_t m, int32_t n) {
+  const user_op::Tensor* bias = ctx->Tensor4ArgNameAndIndex("bias", 0);
+  if (bias == nullptr) { return false; }
+  user_op::Tensor* out = ctx->Tensor4ArgNameAndIndex("out", 0);
+  NdarrayUtil<device_type, T>::BroadcastTo(ctx->device_ctx(),
+                                           XpuVarNdarray<T>(Shape({m, n}), out->mut_dptr<T>()),
+                                           XpuVarNdarray<const T>(Shape({1, n}), bias->dptr<T>()));
+  return true;
+}
+
 }  // namespace
 
 REGISTER_FUNCTION_CONFIG_DEF().Bool(
@@ -56,9 +70,9 @@ class MatmulFloatingKernel final : public user_op::OpKernel {
 
     int32_t m = 0, n = 0, k = 0;
     std::tie(m, n, k) = CalcMNK(a->shape(), out->shape(), trans_a);
+    const T beta = InitOutWithBias<device_type, T>(ctx, m, n) ? GetOneVal<T>() : GetZeroVal<T>();
     NewKernelUtil<device_type>::OFGemm(ctx->device_ctx(), trans_a, trans_b, m, n, k, GetOneVal<T>(),
-                                       a->dptr<T>(), b->dptr<T>(), GetZeroVal<T>(),
-                                       out->mut_dptr<T>());
+                                       a->dptr<T>(), b->dptr<T>(), beta, out->mut_dptr<T>());
   }
 };
 
@@ -91,15 +105,18 @@ class MatmulGpuHalfKernel final : public user_op::OpKernel {
 
     int32_t m = 0, n = 0, k = 0;
     std::tie(m, n, k) = CalcMNK(a->shape(), out->shape(), trans_a);
+    const bool has_bias = InitOutWithBias<DeviceType::kGPU, float16>(ctx, m, n);
 
     if (ctx->job_desc().Bool("enable_float_compute_for_half_gemm")) {
       NewKernelUtil<DeviceType::kGPU>::OFHGemmWithFloat(
           ctx->device_ctx(), trans_a, trans_b, m, n, k, GetOneVal<float>(), a->dptr<float16>(),
-          b->dptr<float16>(), GetZeroVal<float>(), out->mut_dptr<float16>());
+          b->dptr<float16>(), has_bias ? GetOneVal<float>() : GetZeroVal<float>(),
+          out->mut_dptr<float16>());
     } else {
       NewKernelUtil<DeviceType::kGPU>::OFGemm(
           ctx->device_ctx(), trans_a, trans_b, m, n, k, GetOneVal<float16>(), a->dptr<float16>(),
-          b->dptr<float16>(), GetZeroVal<float16>(), out->mut_dptr<float16>());
+          b->dptr<float16>(), has_bias ? GetOneVal<float16>() : GetZeroVal<float16>(),
+          out->mut_dptr<float16>());
     }
   }
 };
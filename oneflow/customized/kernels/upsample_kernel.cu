@@ -28,18 +28,36 @@ __device__ int64_t GetNearestInputIndex(const int64_t out_dim_idx, const float s
              static_cast<int64_t>(0));
 }
 
+// helpers are built on the physical shape, so channels_last tensors are indexed as (n, h, w, c)
+__device__ void OffsetToNchwIndex(const NdIndexOffsetHelper<int64_t, 4>& helper,
+                                  const bool channels_last, const int64_t offset, int64_t* n,
+                                  int64_t* c, int64_t* h, int64_t* w) {
+  if (channels_last) {
+    helper.OffsetToNdIndex(offset, *n, *h, *w, *c);
+  } else {
+    helper.OffsetToNdIndex(offset, *n, *c, *h, *w);
+  }
+}
+
+__device__ int64_t NchwIndexToOffset(const NdIndexOffsetHelper<int64_t, 4>& helper,
+                                     const bool channels_last, const int64_t n, const int64_t c,
+                                     const int64_t h, const int64_t w) {
+  return channels_last ? helper.NdIndexToOffset(n, h, w, c) : helper.NdIndexToOffset(n, c, h, w);
+}
+
 template<typename T>
 __global__ void UpsampleNearestForward(const int64_t elem_cnt, const T* in_dptr,
                                        NdIndexOffsetHelper<int64_t, 4> in_helper,
                                        NdIndexOffsetHelper<int64_t, 4> out_helper,
-                                       const int64_t in_height, const int64_t in_width,
-                                       const float scale_h, const float scale_w, T* out_dptr) {
+                                       const bool channels_last, const int64_t in_height,
+                                       const int64_t in_width, const float scale_h,
+                                       const float scale_w, T* out_dptr) {
   CUDA_1D_KERNEL_LOOP(index, elem_cnt) {
     int64_t n, c, h, w;
-    out_helper.OffsetToNdIndex(index, n, c, h, w);
+    OffsetToNchwIndex(out_helper, channels_last, index, &n, &c, &h, &w);
     const int64_t in_h = GetNearestInputIndex(h, scale_h, in_height);
     const int64_t in_w = GetNearestInputIndex(w, scale_w, in_width);
-    out_dptr[index] = in_dptr[in_helper.NdIndexToOffset(n, c, in_h, in_w)];
+    out_dptr[index] = in_dptr[NchwIndexToOffset(in_helper, channels_last, n, c, in_h, in_w)];
   }
 }
 
@@ -47,14 +65,16 @@ template<typename T>
 __global__ void UpsampleNearestBackward(const int64_t elem_cnt, const T* dy_dptr,
                                         NdIndexOffsetHelper<int64_t, 4> dy_helper,
                                         NdIndexOffsetHelper<int64_t, 4> dx_helper,
-                                        const int64_t dx_height, const int64_t dx_width,
-                                        const float scale_h, const float scale_w, T* dx_dptr) {
+                                        const bool channels_last, const int64_t dx_height,
+                                        const int64_t dx_width, const float scale_h,
+                                        const float scale_w, T* dx_dptr) {
   CUDA_1D_KERNEL_LOOP(index, elem_cnt) {
     int64_t n, c, h, w;
-    dy_helper.OffsetToNdIndex(index, n, c, h, w);
+    OffsetToNchwIndex(dy_helper, channels_last, index, &n, &c, &h, &w);
     const int64_t dx_h = GetNearestInputIndex(h, scale_h, dx_height);
     const int64_t dx_w = GetNearestInputIndex(w, scale_w, dx_width);
-    atomicAdd(dx_dptr + dx_helper.NdIndexToOffset(n, c, dx_h, dx_w), dy_dptr[index]);
+    atomicAdd(dx_dptr + NchwIndexToOffset(dx_helper, channels_last, n, c, dx_h, dx_w),
+              dy_dptr[index]);
   }
 }
 
@@ -84,19 +104,22 @@ template<typename T>
 __global__ void UpsampleBilinearForward(const int64_t elem_cnt, const T* in_dptr,
                                         NdIndexOffsetHelper<int64_t, 4> in_helper,
                                         NdIndexOffsetHelper<int64_t, 4> out_helper,
-                                        const int64_t in_height, const int64_t in_width,
-                                        const float scale_h, const float scale_w, T* out_dptr) {
+                                        const bool channels_last, const int64_t in_height,
+                                        const int64_t in_width, const float scale_h,
+                                        const float scale_w, T* out_dptr) {
   CUDA_1D_KERNEL_LOOP(index, elem_cnt) {
     int64_t n, c, h, w;
-    out_helper.OffsetToNdIndex(index, n, c, h, w);
+    OffsetToNchwIndex(out_helper, channels_last, index, &n, &c, &h, &w);
     BilinearParam params;
     GetBilinearParam(index, h, w, in_height, in_width, scale_h, scale_w, &params);
-    const int64_t top_offset = in_helper.NdIndexToOffset(n, c, params.top_h_index, 0);
-    const int64_t bottom_offset = in_helper.NdIndexToOffset(n, c, params.bottom_h_index, 0);
-    const float top_left = in_dptr[top_offset + params.left_w_index];
-    const float top_right = in_dptr[top_offset + params.right_w_index];
-    const float bottom_left = in_dptr[bottom_offset + params.left_w_index];
-    const float bottom_right = in_dptr[bottom_offset + params.right_w_index];
+    const float top_left = in_dptr[NchwIndexToOffset(in_helper, channels_last, n, c,
+                                                     params.top_h_index, params.left_w_index)];
+    const float top_right = in_dptr[NchwIndexToOffset(in_helper, channels_last, n, c,
+                                                      params.top_h_index, params.right_w_index)];
+    const float bottom_left = in_dptr[NchwIndexToOffset(
+        in_helper, channels_last, n, c, params.bottom_h_index, params.left_w_index)];
+    const float bottom_right = in_dptr[NchwIndexToOffset(
+        in_helper, channels_last, n, c, params.bottom_h_index, params.right_w_index)];
     const float top = top_left + (top_right - top_left) * params.w_lerp;
     const float bottom = bottom_left + (bottom_right - bottom_left) * params.w_lerp;
     out_dptr[index] = top + (bottom - top) * params.h_lerp;
@@ -107,26 +130,33 @@ template<typename T>
 __global__ void UpsampleBilinearBackward(const int64_t elem_cnt, const T* dy_dptr,
                                          NdIndexOffsetHelper<int64_t, 4> dy_helper,
                                          NdIndexOffsetHelper<int64_t, 4> dx_helper,
-                                         const int64_t dx_height, const int64_t dx_width,
-                                         const float scale_h, const float scale_w, T* dx_dptr) {
+                                         const bool channels_last, const int64_t dx_height,
+                                         const int64_t dx_width, const float scale_h,
+                                         const float scale_w, T* dx_dptr) {
   CUDA_1D_KERNEL_LOOP(index, elem_cnt) {
     int64_t n, c, h, w;
-    dy_helper.OffsetToNdIndex(index, n, c, h, w);
+    OffsetToNchwIndex(dy_helper, channels_last, index, &n, &c, &h, &w);
     BilinearParam params;
     GetBilinearParam(index, h, w, dx_height, dx_width, scale_h, scale_w, &params);
-    const int64_t top_offset = dx_helper.NdIndexToOffset(n, c, params.top_h_index, 0);
-    const int64_t bottom_offset = dx_helper.NdIndexToOffset(n, c, params.bottom_h_index, 0);
     const T dy = dy_dptr[index];
     const float dbottom = params.h_lerp * dy;
-    T* dx_dptr_bottom_offset = dx_dptr + bottom_offset;
-    atomicAdd(dx_dptr_bottom_offset + params.left_w_index,
+    atomicAdd(dx_dptr
+                  + NchwIndexToOffset(dx_helper, channels_last, n, c, params.bottom_h_index,
+                                      params.left_w_index),
               static_cast<T>((1 - params.w_lerp) * dbottom));
-    atomicAdd(dx_dptr_bottom_offset + params.right_w_index,
+    atomicAdd(dx_dptr
+                  + NchwIndexToOffset(dx_helper, channels_last, n, c, params.bottom_h_index,
+                                      params.right_w_index),
               static_cast<T>(params.w_lerp * dbottom));
     const float dtop = dy - dbottom;
-    T* dx_dptr_top_offset = dx_dptr + top_offset;
-    atomicAdd(dx_dptr_top_offset + params.left_w_index, static_cast<T>((1 - params.w_lerp) * dtop));
-    atomicAdd(dx_dptr_top_offset + params.right_w_index, static_cast<T>(params.w_lerp * dtop));
+    atomicAdd(dx_dptr
+                  + NchwIndexToOffset(dx_helper, channels_last, n, c, params.top_h_index,
+                                      params.left_w_index),
+              static_cast<T>((1 - params.w_lerp) * dtop));
+    atomicAdd(dx_dptr
+                  + NchwIndexToOffset(dx_helper, channels_last, n, c, params.top_h_index,
+                                      params.right_w_index),
+              static_cast<T>(params.w_lerp * dtop));
   }
 }
 
@@ -149,11 +179,13 @@ class UpsampleNearestGPUKernel final : public user_op::OpKernel {
                                               x_blob->shape().At(2), x_blob->shape().At(3));
     NdIndexOffsetHelper<int64_t, 4> out_helper(y_blob->shape().At(0), y_blob->shape().At(1),
                                                y_blob->shape().At(2), y_blob->shape().At(3));
+    const bool channels_last = ctx->Attr<std::string>("data_format") == "channels_last";
+    const int64_t h_axis = channels_last ? 1 : 2;
 
     RUN_CUDA_KERNEL((UpsampleNearestForward<T>), ctx->device_ctx(), elem_cnt, elem_cnt,
-                    x_blob->dptr<T>(), in_helper, out_helper, x_blob->shape().At(2),
-                    x_blob->shape().At(3), 1.f / height_scale, 1.f / width_scale,
-                    y_blob->mut_dptr<T>());
+                    x_blob->dptr<T>(), in_helper, out_helper, channels_last,
+                    x_blob->shape().At(h_axis), x_blob->shape().At(h_axis + 1), 1.f / height_scale,
+                    1.f / width_scale, y_blob->mut_dptr<T>());
   }
   bool AlwaysComputeWhenAllOutputsEmpty() const override { return false; }
 };
@@ -178,10 +210,12 @@ class UpsampleNearestGradGPUKernel final : public user_op::OpKernel {
                                               dy_blob->shape().At(2), dy_blob->shape().At(3));
     NdIndexOffsetHelper<int64_t, 4> dx_helper(dx_blob->shape().At(0), dx_blob->shape().At(1),
                                               dx_blob->shape().At(2), dx_blob->shape().At(3));
+    const bool channels_last = ctx->Attr<std::string>("data_format") == "channels_last";
+    const int64_t h_axis = channels_last ? 1 : 2;
     RUN_CUDA_KERNEL((UpsampleNearestBackward<T>), ctx->device_ctx(), elem_cnt, elem_cnt,
-                    dy_blob->dptr<T>(), dy_helper, dx_helper, dx_blob->shape().At(2),
-                    dx_blob->shape().At(3), 1.f / height_scale, 1.f / width_scale,
-                    dx_blob->mut_dptr<T>());
+                    dy_blob->dptr<T>(), dy_helper, dx_helper, channels_last,
+                    dx_blob->shape().At(h_axis), dx_blob->shape().At(h_axis + 1),
+                    1.f / height_scale, 1.f / width_scale, dx_blob->mut_dptr<T>());
   }
   bool AlwaysComputeWhenAllOutputsEmpty() const override { return false; }
 };
@@ -220,11 +254,13 @@ class UpsampleBilinearGPUKernel final : public user_op::OpKernel {
                                               x_blob->shape().At(2), x_blob->shape().At(3));
     NdIndexOffsetHelper<int64_t, 4> out_helper(y_blob->shape().At(0), y_blob->shape().At(1),
                                                y_blob->shape().At(2), y_blob->shape().At(3));
+    const bool channels_last = ctx->Attr<std::string>("data_format") == "channels_last";
+    const int64_t h_axis = channels_last ? 1 : 2;
 
     RUN_CUDA_KERNEL((UpsampleBilinearForward<T>), ctx->device_ctx(), elem_cnt, elem_cnt,
-                    x_blob->dptr<T>(), in_helper, out_helper, x_blob->shape().At(2),
-                    x_blob->shape().At(3), 1.f / height_scale, 1.f / width_scale,
-                    y_blob->mut_dptr<T>());
+                    x_blob->dptr<T>(), in_helper, out_helper, channels_last,
+                    x_blob->shape().At(h_axis), x_blob->shape().At(h_axis + 1), 1.f / height_scale,
+                    1.f / width_scale, y_blob->mut_dptr<T>());
   }
   bool AlwaysComputeWhenAllOutputsEmpty() const override { return false; }
 };
@@ -249,11 +285,13 @@ class UpsampleBilinearGradGPUKernel final : public user_op::OpKernel {
                                               dy_blob->shape().At(2), dy_blob->shape().At(3));
     NdIndexOffsetHelper<int64_t, 4> dx_helper(dx_blob->shape().At(0), dx_blob->shape().At(1),
                                               dx_blob->shape().At(2), dx_blob->shape().At(3));
+    const bool channels_last = ctx->Attr<std::string>("data_format") == "channels_last";
+    const int64_t h_axis = channels_last ? 1 : 2;
 
     RUN_CUDA_KERNEL((UpsampleBilinearBackward<T>), ctx->device_ctx(), elem_cnt, elem_cnt,
-                    dy_blob->dptr<T>(), dy_helper, dx_helper, dx_blob->shape().At(2),
-                    dx_blob->shape().At(3), 1.f / height_scale, 1.f / width_scale,
-                    dx_blob->mut_dptr<T>());
+                    dy_blob->dptr<T>(), dy_helper, dx_helper, channels_last,
+                    dx_blob->shape().At(h_axis), dx_blob->shape().At(h_axis + 1),
+                    1.f / height_scale, 1.f / width_scale, dx_blob->mut_dptr<T>());
   }
   bool AlwaysComputeWhenAllOutputsEmpty() const override { return false; }
 };
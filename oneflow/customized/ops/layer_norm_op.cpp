@@ -155,7 +155,6 @@ REGISTER_USER_OP("layer_norm_param_grad")
     .OptionalOutput("normalized_diff")
     .OptionalOutput("beta_diff")
     .OptionalOutput("gamma_diff")
-    .OptionalOutput("reduce_buf")
     .Attr("begin_params_axis", UserOpAttrType::kAtInt64)
     .SetTensorDescInferFn([](user_op::InferContext* ctx) -> Maybe<void> {
       // TODO: tsai: replace lambda with user op if
@@ -175,10 +174,6 @@ REGISTER_USER_OP("layer_norm_param_grad")
       const bool has_gamma_diff = has_tensor("gamma_diff");
       const bool has_gamma = has_tensor("gamma");
       const bool has_normalized_diff = has_tensor("normalized_diff");
-      if (has_beta_diff || has_gamma_diff) {
-        user_op::TensorDesc* reduce_buf = ctx->TensorDesc4ArgNameAndIndex("reduce_buf", 0);
-        *reduce_buf = *dy;
-      }
       CHECK_GE_OR_RETURN(begin_params_axis, 1);
       CHECK_LT_OR_RETURN(begin_params_axis, dy->shape().NumAxes());
       DimVector param_shape_dim_vec;
@@ -277,7 +272,6 @@ REGISTER_USER_OP_GRAD("layer_norm")
           grad_op_builder.Output("gamma_diff");
         }
         if (need_scale_out_diff) { grad_op_builder.Output("normalized_diff"); }
-        if (has_beta_diff || has_gamma_diff) { grad_op_builder.Output("reduce_buf"); }
         auto grad_op = grad_op_builder.Build();
         if (has_beta_diff) {
           op.BindGradTensorWithOpInput(grad_op.output("beta_diff", 0), "beta", 0);
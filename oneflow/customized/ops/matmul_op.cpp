@@ -54,6 +54,13 @@ Maybe<void> InferTensorDesc4Matmul(user_op::InferContext* ctx) {
   }
   out->mut_shape()->Set(num_axes - 2, m);
   out->mut_shape()->Set(num_axes - 1, n);
+
+  const user_op::TensorDesc* bias = ctx->TensorDesc4ArgNameAndIndex("bias", 0);
+  if (bias != nullptr) {
+    CHECK_EQ_OR_RETURN(num_axes, 2);
+    CHECK_EQ_OR_RETURN(bias->data_type(), a->data_type());
+    CHECK_EQ_OR_RETURN(bias->shape(), Shape({n}));
+  }
   return Maybe<void>::Ok();
 }
 
@@ -124,6 +131,7 @@ void GenBackwardOpConf4Matmul(const std::string& op_type_name, const user_op::Us
 REGISTER_USER_OP("matmul")
     .Input("a")
     .Input("b")
+    .OptionalInput("bias")
     .Output("out")
     .Attr<bool>("transpose_a", UserOpAttrType::kAtBool, false)
     .Attr<bool>("transpose_b", UserOpAttrType::kAtBool, false)
@@ -169,6 +177,30 @@ REGISTER_USER_OP("matmul")
         k_b_axis = 0;
         n_axis = 1;
       }
+      bool has_bias = false;
+      for (const auto& pair : ctx->inputs()) {
+        if (pair.first == "bias") {
+          CHECK_EQ_OR_RETURN(0, pair.second);
+          has_bias = true;
+          break;
+        }
+      }
+      if (has_bias) {
+        // bias is added once per output element, so the partial sum signatures don't apply
+        ctx->NewBuilder()
+            .Split(user_op::OpArg("a", 0), m_axis)
+            .Broadcast(user_op::OpArg("b", 0))
+            .Broadcast(user_op::OpArg("bias", 0))
+            .Split(ctx->outputs(), 0)
+            .Build();
+        ctx->NewBuilder()
+            .Broadcast(user_op::OpArg("a", 0))
+            .Split(user_op::OpArg("b", 0), n_axis)
+            .Split(user_op::OpArg("bias", 0), 0)
+            .Split(ctx->outputs(), 1)
+            .Build();
+        return Maybe<void>::Ok();
+      }
       ctx->NewBuilder()
           .Split(user_op::OpArg("a", 0), m_axis)
           .Broadcast(user_op::OpArg("b", 0))
@@ -199,7 +231,19 @@ REGISTER_USER_OP("matmul")
 
 REGISTER_USER_OP_GRAD("matmul").SetGenBackwardOpConfFn([](const user_op::UserOpWrapper& op,
                                                           user_op::AddOpFn AddOp) {
-  return GenBackwardOpConf4Matmul("matmul", op, AddOp);
+  GenBackwardOpConf4Matmul("matmul", op, AddOp);
+  if (op.user_op_conf().has_input("bias", 0) && op.NeedGenGradTensor4OpInput("bias", 0)) {
+    user_op::UserOpConfWrapper grad_bias_op =
+        user_op::UserOpConfWrapperBuilder(op.op_name() + "_grad_bias")
+            .Op("reduce_sum")
+            .Input("input_tensor", op.GetGradTensorWithOpOutput("out", 0))
+            .Output("output_tensor")
+            .Attr<std::vector<int32_t>>("axis", {0})
+            .Attr<bool>("keepdims", false)
+            .Build();
+    op.BindGradTensorWithOpInput(grad_bias_op.output("output_tensor", 0), "bias", 0);
+    AddOp(grad_bias_op);
+  }
 });
 
 REGISTER_USER_OP("batch_matmul")
@@ -29,13 +29,16 @@ REGISTER_USER_OP("upsample")
       user_op::TensorDesc* y_desc = ctx->TensorDesc4ArgNameAndIndex("y", 0);
       const float height_scale = ctx->Attr<float>("height_scale");
       const float width_scale = ctx->Attr<float>("width_scale");
-      if (ctx->Attr<std::string>("data_format") != "channels_first"
-          || x_desc->shape().NumAxes() != 4) {
-        LOG(FATAL) << "upsample only supports NCHW";
-      }
-      *y_desc->mut_shape() = Shape({x_desc->shape().At(0), x_desc->shape().At(1),
-                                    static_cast<int32_t>(height_scale) * x_desc->shape().At(2),
-                                    static_cast<int32_t>(width_scale) * x_desc->shape().At(3)});
+      const std::string& data_format = ctx->Attr<std::string>("data_format");
+      CHECK_OR_RETURN(data_format == "channels_first" || data_format == "channels_last")
+          << "upsample only supports NCHW and NHWC";
+      CHECK_EQ_OR_RETURN(x_desc->shape().NumAxes(), 4);
+      const int64_t h_axis = data_format == "channels_last" ? 1 : 2;
+      *y_desc->mut_shape() = x_desc->shape();
+      y_desc->mut_shape()->Set(h_axis,
+                               static_cast<int32_t>(height_scale) * x_desc->shape().At(h_axis));
+      y_desc->mut_shape()->Set(h_axis + 1,
+                               static_cast<int32_t>(width_scale) * x_desc->shape().At(h_axis + 1));
       return Maybe<void>::Ok();
     })
     .SetBatchAxisInferFn([](user_op::BatchAxisContext* ctx) -> Maybe<void> {
@@ -59,12 +62,14 @@ REGISTER_USER_OP("upsample_grad")
       Shape* dx_shape = ctx->Shape4ArgNameAndIndex("dx", 0);
       const float height_scale = ctx->Attr<float>("height_scale");
       const float width_scale = ctx->Attr<float>("width_scale");
-      if (ctx->Attr<std::string>("data_format") != "channels_first" || dy_shape->NumAxes() != 4) {
-        LOG(FATAL) << "upsample_nearest only supports NCHW";
-      }
-      *dx_shape = Shape({dy_shape->At(0), dy_shape->At(1),
-                         dy_shape->At(2) / static_cast<int32_t>(height_scale),
-                         dy_shape->At(3) / static_cast<int32_t>(width_scale)});
+      const std::string& data_format = ctx->Attr<std::string>("data_format");
+      CHECK_OR_RETURN(data_format == "channels_first" || data_format == "channels_last")
+          << "upsample only supports NCHW and NHWC";
+      CHECK_EQ_OR_RETURN(dy_shape->NumAxes(), 4);
+      const int64_t h_axis = data_format == "channels_last" ? 1 : 2;
+      *dx_shape = *dy_shape;
+      dx_shape->Set(h_axis, dy_shape->At(h_axis) / static_cast<int32_t>(height_scale));
+      dx_shape->Set(h_axis + 1, dy_shape->At(h_axis + 1) / static_cast<int32_t>(width_scale));
       return Maybe<void>::Ok();
     })
     .SetGetSbpFn([](user_op::SbpContext* ctx) -> Maybe<void> {
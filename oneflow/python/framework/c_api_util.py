@@ -15,6 +15,8 @@ limitations under the License.
 """
 from __future__ import absolute_import
 
+import functools
+
 from google.protobuf import text_format
 
 import oneflow.core.common.data_type_pb2 as dtype_util
@@ -222,6 +224,8 @@ def GetOpParallelSymbolId(op_conf_proto):
     return symbol_id
 
 
+# attr types are fixed when an op is registered, so each lookup only needs to cross into C++ once
+@functools.lru_cache(maxsize=None)
 def GetUserOpAttrType(op_type_name, attr_name):
     attr_type, error_str = oneflow_internal.GetUserOpAttrType(op_type_name, attr_name)
     error = text_format.Parse(error_str, error_util.ErrorProto())
@@ -95,6 +95,8 @@ def FlowToOnnxNaive(graph, shape_override):
                         ipts.append(val.s[0])
                         break
                 else:
+                    if ibn in handler.flow_op.optional_ibn4op_type(get_op_type(node)):
+                        continue
                     raise ValueError(
                         "ibn {} of node {} (type {}) not found".format(
                             ibn, node.name, get_op_type(node)
@@ -37,6 +37,7 @@ class flow_op:
     _OPSETS = collections.OrderedDict()
     _MAPPING = None
     _OP_TYPE_2_IBN = {}
+    _OP_TYPE_2_OPTIONAL_IBN = {}
     _OP_TYPE_2_OBN = {}
     name_set = set()
 
@@ -47,12 +48,14 @@ class flow_op:
         domain=constants.ONNX_DOMAIN,
         flow_ibns=None,
         flow_obns=None,
+        flow_optional_ibns=None,
         **kwargs
     ):
         """Called decorator from decorator.
 
         :param name: The name of the oneflow operator.
         :param domain: The domain the operator belongs to, defaults to onnx.
+        :param flow_optional_ibns: The subset of flow_ibns that may be absent from the op.
         :param kwargs: Dictionary that are passed to the handler. A key 'onnx_op' will change the operator name.
         """
         if not isinstance(name, list):
@@ -65,6 +68,7 @@ class flow_op:
         self.kwargs = kwargs
         self.flow_ibns = flow_ibns
         self.flow_obns = flow_obns
+        self.flow_optional_ibns = flow_optional_ibns or []
 
     def __call__(self, func):
         opset = flow_op._OPSETS.get(self.domain)
@@ -82,6 +86,7 @@ class flow_op:
                     flow_op.name_set.add(name)
                     if self.flow_ibns is not None:
                         flow_op._OP_TYPE_2_IBN[name] = self.flow_ibns
+                        flow_op._OP_TYPE_2_OPTIONAL_IBN[name] = self.flow_optional_ibns
                     if self.flow_obns is not None:
                         flow_op._OP_TYPE_2_OBN[name] = self.flow_obns
         return func
@@ -90,6 +95,10 @@ class flow_op:
     def ibn4op_type(op_type):
         return flow_op._OP_TYPE_2_IBN.get(op_type, None)
 
+    @staticmethod
+    def optional_ibn4op_type(op_type):
+        return flow_op._OP_TYPE_2_OPTIONAL_IBN.get(op_type, [])
+
     @staticmethod
     def obn4op_type(op_type):
         return flow_op._OP_TYPE_2_OBN.get(op_type, None)
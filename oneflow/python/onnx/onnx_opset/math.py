@@ -405,10 +405,26 @@ class Sign:
             )
 
 
-@flow_op(["matmul", "batch_matmul"], "MatMul", flow_ibns=["a", "b"])
+@flow_op(
+    ["matmul", "batch_matmul"],
+    "MatMul",
+    flow_ibns=["a", "b", "bias"],
+    flow_optional_ibns=["bias"],
+)
 class MatMul:
     @classmethod
     def Version_1(cls, ctx, node, **kwargs):
+        if len(node.input) == 3:
+            # onnx MatMul has no bias input, add it to the product instead
+            bias = node.input[2]
+            ctx.RemoveInput(node, bias)
+            add_node = ctx.InsertNewNodeOnOutput(
+                "Add", node.output[0], name=id_util.UniqueStr(node.name + "_bias_add")
+            )
+            add_node.input.append(bias)
+            ctx.CopyShape(node.output[0], add_node.output[0])
+            ctx.set_dtype(add_node.output[0], ctx.get_dtype(node.output[0]))
+
         attrs = ["transpose_a", "transpose_b"]
         attrs_val = [node.get_attr(attr) for attr in attrs]
         attrs_val = [0 if val is None else val.i for val in attrs_val]
@@ -179,7 +179,7 @@ def conv_kernel_shape(ctx, node, input_idx, spatial=2):
     return kernel_shape
 
 
-@flow_op(["conv2d"], flow_ibns=["in", "weight"])
+@flow_op(["conv2d"], flow_ibns=["in", "weight", "bias"], flow_optional_ibns=["bias"])
 class ConvOp:
     @classmethod
     def Version_1(cls, ctx, node, **kwargs):
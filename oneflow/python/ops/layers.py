@@ -22,6 +22,10 @@ import oneflow.core.operator.op_conf_pb2 as op_conf_util
 import oneflow.python.framework.distribute as distribute_util
 import oneflow.python.framework.remote_blob as remote_blob_util
 
+_AUTO = distribute_util.auto()
+_BROADCAST = distribute_util.broadcast()
+_SPLIT0 = distribute_util.split(0)
+
 IntPair = Tuple[int, int]
 
 
@@ -40,6 +44,7 @@ def dense(
     trainable: bool = True,
     name: str = "Dense",
     model_distribute: distribute_util.Distribute = distribute_util.broadcast(),
+    shared_weight: Optional[remote_blob_util.BlobDef] = None,
 ) -> remote_blob_util.BlobDef:
     r"""Analogous to `tf.keras.layers.Dense <https://www.tensorflow.org/api_docs/python/tf/keras/layers/Dense>`_
 
@@ -55,6 +60,7 @@ def dense(
         trainable (bool, optional): A boolean specifies whether to train the variables. Defaults to True.
         name (Optional[str], optional): This layer's name. Defaults to None.
         model_distribute (distribute_util.Distribute, optional): Define the way to ditribute the model. Defaults to distribute_util.broadcast().
+        shared_weight (Optional[remote_blob_util.BlobDef], optional): A `Blob` of shape (units, in_features) used as the weight instead of creating one, e.g. for tied embeddings. kernel_initializer and kernel_regularizer are ignored when it is given, and trainable no longer applies to the weight. Defaults to None.
 
     Returns:
         remote_blob_util.BlobDef:  A N-D `Blob` with the shape of (batch_size, units).  
@@ -68,37 +74,37 @@ def dense(
     in_num_axes = len(in_shape)
     assert in_num_axes >= 2
 
-    assert (
-        model_distribute is distribute_util.auto()
-        or model_distribute is distribute_util.broadcast()
-        or model_distribute is distribute_util.split(0)
-    )
+    assert model_distribute in (_AUTO, _BROADCAST, _SPLIT0)
 
-    if model_distribute is distribute_util.split(0):
+    if model_distribute is _SPLIT0:
         assert in_num_axes == 2  # model distribute is hard for reshape split dim 1
 
     if in_num_axes > 2:
         inputs = flow.reshape(inputs, (-1, in_shape[-1]))
 
     with flow.scope.namespace(name):
-        if kernel_initializer is None:
-            kernel_initializer = flow.constant_initializer(0)
+        if shared_weight is not None:
+            assert tuple(shared_weight.shape) == (units, inputs.shape[1])
+            assert shared_weight.dtype == inputs.dtype
+            weight = shared_weight
+        else:
+            if kernel_initializer is None:
+                kernel_initializer = flow.constant_initializer(0)
 
-        weight = flow.get_variable(
-            name="weight",
-            shape=(units, inputs.shape[1]),
-            dtype=inputs.dtype,
-            initializer=kernel_initializer,
-            regularizer=kernel_regularizer,
-            trainable=trainable,
-            model_name="weight",
-            distribute=model_distribute,
-            reuse=False,
-        )
+            weight = flow.get_variable(
+                name="weight",
+                shape=(units, inputs.shape[1]),
+                dtype=inputs.dtype,
+                initializer=kernel_initializer,
+                regularizer=kernel_regularizer,
+                trainable=trainable,
+                model_name="weight",
+                distribute=model_distribute,
+                reuse=False,
+            )
         weight = weight.with_distribute(model_distribute)
 
-        out = flow.matmul(a=inputs, b=weight, transpose_b=True, name="matmul")
-
+        bias = None
         if use_bias:
             if bias_initializer is None:
                 bias_initializer = flow.constant_initializer(0)
@@ -115,7 +121,11 @@ def dense(
                 reuse=False,
             )
             bias = bias.with_distribute(model_distribute)
-            out = flow.nn.bias_add(out, bias, name="bias_add")
+
+        # the matmul kernel adds bias in place of a separate bias_add op
+        out = flow.matmul(
+            a=inputs, b=weight, transpose_b=True, name="matmul", bias=bias
+        )
 
         if callable(activation):
             out = activation(out, name="activation")
@@ -241,17 +251,7 @@ def conv2d(
             reuse=False,
         )
 
-    output = flow.nn.conv2d(
-        inputs,
-        weight,
-        strides,
-        padding,
-        data_format,
-        dilation_rate,
-        groups=groups,
-        name=name,
-    )
-
+    bias = None
     if use_bias:
         if bias_initializer is None:
             bias_initializer = flow.constant_initializer(0)
@@ -280,12 +280,30 @@ def conv2d(
                 reuse=False,
             )
 
-        with flow.scope.namespace(name):
-            output = flow.nn.bias_add(output, bias, data_format, name="bias_add")
+    # the conv kernels add bias in place of a separate bias_add op, but cudnn only
+    # supports channels last bias for float, and auto mixed precision may cast it
+    # to half after the graph is built, so NHWC keeps bias_add
+    fuse_bias = use_bias and data_format.upper() == "NCHW"
 
-    if callable(activation):
+    output = flow.nn.conv2d(
+        inputs,
+        weight,
+        strides,
+        padding,
+        data_format,
+        dilation_rate,
+        groups=groups,
+        name=name,
+        bias=bias if fuse_bias else None,
+    )
+
+    # every namespace entry builds a new scope, so enter it once for the tail ops
+    if (use_bias and not fuse_bias) or callable(activation):
         with flow.scope.namespace(name):
-            output = activation(output, name="activation")
+            if use_bias and not fuse_bias:
+                output = flow.nn.bias_add(output, bias, data_format, name="bias_add")
+            if callable(activation):
+                output = activation(output, name="activation")
 
     return output
 
@@ -329,36 +347,34 @@ def layer_norm(
         trainable = False
 
     param_shape = inputs.shape[begin_params_axis:]
-    if center:
+    if center or scale:
         with flow.scope.namespace(name):
-            beta = flow.get_variable(
-                name="beta",
-                shape=param_shape,
-                dtype=inputs.dtype,
-                initializer=flow.constant_initializer(0.0),
-                trainable=trainable,
-                model_name="beta",
-                distribute=distribute_util.broadcast(),
-                reuse=False,
-            )
-
-        op_builder.Input("beta", [beta])
-
-    if scale:
-        with flow.scope.namespace(name):
-            gamma = flow.get_variable(
-                name="gamma",
-                shape=param_shape,
-                dtype=inputs.dtype,
-                initializer=flow.constant_initializer(1.0),
-                trainable=trainable,
-                model_name="gamma",
-                distribute=distribute_util.broadcast(),
-                reuse=False,
-            )
+            if center:
+                beta = flow.get_variable(
+                    name="beta",
+                    shape=param_shape,
+                    dtype=inputs.dtype,
+                    initializer=flow.constant_initializer(0.0),
+                    trainable=trainable,
+                    model_name="beta",
+                    distribute=_BROADCAST,
+                    reuse=False,
+                )
+                op_builder.Input("beta", [beta])
 
-        op_builder.Input("gamma", [gamma])
-        op_builder.Output("normalized")
+            if scale:
+                gamma = flow.get_variable(
+                    name="gamma",
+                    shape=param_shape,
+                    dtype=inputs.dtype,
+                    initializer=flow.constant_initializer(1.0),
+                    trainable=trainable,
+                    model_name="gamma",
+                    distribute=_BROADCAST,
+                    reuse=False,
+                )
+                op_builder.Input("gamma", [gamma])
+                op_builder.Output("normalized")
 
     op_builder.Attr("center", center)
     op_builder.Attr("scale", scale)
@@ -440,17 +456,11 @@ def layer_norm_param_grad(
         .Output("normalized_diff")
         .Output("beta_diff")
         .Output("gamma_diff")
-        .Output("reduce_buf")
         .Attr("begin_params_axis", begin_params_axis)
         .Build()
     )
 
-    (
-        normalized_diff,
-        beta_diff,
-        gamma_diff,
-        reduce_buf,
-    ) = op.InferAndTryRun().RemoteBlobList()
+    normalized_diff, beta_diff, gamma_diff = op.InferAndTryRun().RemoteBlobList()
 
     return normalized_diff, beta_diff, gamma_diff
 
@@ -518,7 +528,7 @@ def batch_normalization(
                 initializer=beta_initializer or flow.zeros_initializer(),
                 regularizer=beta_regularizer,
                 trainable=trainable,
-                distribute=distribute_util.broadcast(),
+                distribute=_BROADCAST,
                 reuse=False,
             )
         else:
@@ -532,7 +542,7 @@ def batch_normalization(
                 initializer=gamma_initializer or flow.ones_initializer(),
                 regularizer=gamma_regularizer,
                 trainable=trainable,
-                distribute=distribute_util.broadcast(),
+                distribute=_BROADCAST,
                 reuse=False,
             )
         else:
@@ -546,7 +556,7 @@ def batch_normalization(
             dtype=params_dtype,
             initializer=moving_mean_initializer or flow.zeros_initializer(),
             trainable=False,
-            distribute=distribute_util.broadcast(),
+            distribute=_BROADCAST,
             reuse=False,
         )
 
@@ -556,7 +566,7 @@ def batch_normalization(
             dtype=params_dtype,
             initializer=moving_variance_initializer or flow.ones_initializer(),
             trainable=False,
-            distribute=distribute_util.broadcast(),
+            distribute=_BROADCAST,
             reuse=False,
         )
 
@@ -620,13 +630,6 @@ def upsample(
     if data_format.upper() != "NCHW" and data_format.upper() != "NHWC":
         raise ValueError('data_format must be "NHWC" or "NCHW".')
 
-    need_transpose = 0
-    if data_format.upper() == "NHWC":
-        need_transpose = 1
-
-    if need_transpose:
-        x = flow.transpose(x, perm=[0, 3, 1, 2])
-
     op = (
         flow.user_op_builder(name)
         .Op("upsample")
@@ -634,13 +637,11 @@ def upsample(
         .Output("y")
         .Attr("height_scale", float(height_scale))
         .Attr("width_scale", float(width_scale))
-        .Attr("data_format", "channels_first")
+        .Attr(
+            "data_format",
+            "channels_first" if data_format.upper() == "NCHW" else "channels_last",
+        )
         .Attr("interpolation", interpolation)
         .Build()
     )
-    output = op.InferAndTryRun().SoleOutputBlob()
-
-    if need_transpose:
-        output = flow.transpose(output, perm=[0, 2, 3, 1])
-
-    return output
+    return op.InferAndTryRun().SoleOutputBlob()
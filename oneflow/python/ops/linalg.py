@@ -34,17 +34,21 @@ def matmul(
     transpose_a: bool = False,
     transpose_b: bool = False,
     name: Optional[str] = None,
+    bias: Optional[remote_blob_util.BlobDef] = None,
 ) -> remote_blob_util.BlobDef:
     r"""
     Analogous to `tf.linalg.matmul <https://www.tensorflow.org/api_docs/python/tf/linalg/matmul>`_
 
+    If `bias` is given, it is added to each row of the product inside the matmul kernel,
+    which is only supported for 2D inputs.
+
     """
     assert len(a.shape) == len(b.shape)
     assert len(a.shape) >= 2
     if name is None:
         name = id_util.UniqueStr("Matmul_")
     if len(a.shape) == 2:
-        op = (
+        op_builder = (
             flow.user_op_builder(name)
             .Op("matmul")
             .Input("a", [a])
@@ -52,9 +56,13 @@ def matmul(
             .Output("out")
             .Attr("transpose_a", transpose_a)
             .Attr("transpose_b", transpose_b)
-            .Build()
         )
+        if bias is not None:
+            assert len(bias.shape) == 1
+            op_builder = op_builder.Input("bias", [bias])
+        op = op_builder.Build()
     else:
+        assert bias is None, "bias is only supported by 2D matmul"
         op = (
             flow.user_op_builder(name)
             .Op("batch_matmul")
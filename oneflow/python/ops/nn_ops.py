@@ -202,6 +202,7 @@ def conv2d(
     dilations: Optional[Union[int, IntPair]] = None,
     groups: int = 1,
     name: Optional[str] = None,
+    bias: Optional[remote_blob_util.BlobDef] = None,
 ) -> remote_blob_util.BlobDef:
     r"""Analogous to `tf.nn.conv2d <https://www.tensorflow.org/api_docs/python/tf/nn/conv2d>`_
 
@@ -214,6 +215,7 @@ def conv2d(
         dilations (Optional[Union[int, IntPair]], optional):  The dilation factor for each dimension of`input`. Defaults to None.
         groups (int, optional): int value greater than 0. Defaults to 1.
         name (Optional[str], optional): This operator's name. Defaults to None.
+        bias (Optional[remote_blob_util.BlobDef], optional): A 1D `Blob` with shape `[out_channels]` added to the output inside the conv kernel. Defaults to None.
 
     Raises:
         ValueError: strides must be an int or a list.
@@ -282,7 +284,7 @@ def conv2d(
     assert len(pads_list) == len(inputs.shape) - 2
     padding_before = [pad[0] for pad in pads_list]
 
-    return (
+    op_builder = (
         flow.user_op_builder(name if name is not None else id_util.UniqueStr("Conv2d_"))
         .Op("conv2d")
         .Input("in", [inputs])
@@ -295,10 +297,13 @@ def conv2d(
         .Attr("strides", strides)
         .Attr("dilation_rate", dilations)
         .Attr("groups", groups)
-        .Build()
-        .InferAndTryRun()
-        .RemoteBlobList()[0]
     )
+    if bias is not None:
+        assert len(bias.shape) == 1
+        assert bias.shape[0] == filters.shape[0]
+        op_builder.Input("bias", [bias])
+
+    return op_builder.Build().InferAndTryRun().RemoteBlobList()[0]
 
 
 @oneflow_export("nn.batch_normalization")
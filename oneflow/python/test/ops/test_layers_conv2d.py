@@ -54,22 +54,53 @@ def grouped_convolution2D(
 
 
 def compare_with_tensorflow(
-    test_case, device_type, x_shape, filters, kernel_size, groups
+    test_case,
+    device_type,
+    x_shape,
+    filters,
+    kernel_size,
+    groups,
+    use_bias=False,
+    data_format="NCHW",
+    amp=False,
 ):
     assert device_type in ["gpu", "cpu"]
+    assert data_format in ["NCHW", "NHWC"]
+    # x_shape is always given as NCHW
+    channels_last = data_format == "NHWC"
+    if channels_last:
+        assert groups == 1
+        of_x_shape = (x_shape[0], x_shape[2], x_shape[3], x_shape[1])
+        weight_shape = (filters, kernel_size, kernel_size, x_shape[1])
+        # oneflow NHWC weight is (out, h, w, in), tensorflow expects (h, w, in, out)
+        weight_perm = (1, 2, 3, 0)
+    else:
+        of_x_shape = x_shape
+        weight_shape = (filters, x_shape[1] // groups, kernel_size, kernel_size)
+        weight_perm = (2, 3, 1, 0)
+
+    def to_nhwc(arr):
+        return arr if channels_last else arr.transpose(0, 2, 3, 1)
+
+    # keep half outputs well inside the float16 range under amp
+    init_max = 1 if amp else 100
+    rtol, atol = (1e-2, 1e-2) if amp else (1e-5, 1e-5)
 
     flow.clear_default_session()
     func_config = flow.FunctionConfig()
     func_config.default_data_type(flow.float)
+    if amp:
+        assert device_type == "gpu"
+        func_config.enable_auto_mixed_precision(True)
 
     @flow.global_function(type="train", function_config=func_config)
     def ConvJob():
         with flow.scope.placement(device_type, "0:0"):
             x = flow.get_variable(
                 "x",
-                shape=x_shape,
+                shape=of_x_shape,
                 dtype=flow.float,
-                initializer=flow.random_uniform_initializer(minval=0, maxval=100),
+                initializer=flow.random_uniform_initializer(minval=0, maxval=init_max),
                 trainable=True,
             )
             loss = flow.layers.conv2d(
@@ -78,21 +109,24 @@ def compare_with_tensorflow(
                 kernel_size=kernel_size,
                 strides=[1, 1],
                 padding="valid",
-                data_format="NCHW",
+                data_format=data_format,
                 dilation_rate=1,
                 groups=groups,
-                use_bias=False,
+                use_bias=use_bias,
                 kernel_initializer=flow.random_uniform_initializer(
-                    minval=0, maxval=100
+                    minval=0, maxval=init_max
+                ),
+                bias_initializer=flow.random_uniform_initializer(
+                    minval=0, maxval=init_max
                 ),
                 weight_name="conv2d_weight",
+                bias_name="conv2d_bias",
             )
-            weight_shape = (filters, x.shape[1] // groups, kernel_size, kernel_size)
             weight = flow.get_variable(
                 name="conv2d_weight",
                 shape=weight_shape,
                 dtype=flow.float,
-                initializer=flow.random_uniform_initializer(minval=0, maxval=100),
+                initializer=flow.random_uniform_initializer(minval=0, maxval=init_max),
             )
             flow.optimizer.SGD(
                 flow.optimizer.PiecewiseConstantScheduler([], [1e-4]), momentum=0
@@ -102,6 +136,17 @@ def compare_with_tensorflow(
             flow.watch_diff(x, test_global_storage.Setter("x_diff"))
             flow.watch(weight, test_global_storage.Setter("weight"))
             flow.watch_diff(weight, test_global_storage.Setter("weight_diff"))
+            if use_bias:
+                bias = flow.get_variable(
+                    name="conv2d_bias",
+                    shape=(filters,),
+                    dtype=flow.float,
+                    initializer=flow.random_uniform_initializer(
+                        minval=0, maxval=init_max
+                    ),
+                )
+                flow.watch(bias, test_global_storage.Setter("bias"))
+                flow.watch_diff(bias, test_global_storage.Setter("bias_diff"))
             flow.watch(loss, test_global_storage.Setter("loss"))
             flow.watch_diff(loss, test_global_storage.Setter("loss_diff"))
 
@@ -114,54 +159,67 @@ def compare_with_tensorflow(
 
     # TensorFlow
     with tf.GradientTape(persistent=True) as tape:
-        x = tf.Variable(test_global_storage.Get("x").transpose(0, 2, 3, 1))
+        x = tf.Variable(to_nhwc(test_global_storage.Get("x")))
         assert groups > 0
         assert x_shape[1] % groups == 0
         assert filters % groups == 0
         if groups == 1:
             weight = tf.Variable(
-                test_global_storage.Get("weight").transpose(2, 3, 1, 0)
+                test_global_storage.Get("weight").transpose(weight_perm)
             )
             tf_out = tf.nn.conv2d(
                 x, weight, strides=[1, 1, 1, 1], padding="VALID", data_format="NHWC"
             )
         else:
             weight = tf.Variable(
-                test_global_storage.Get("weight").transpose(2, 3, 1, 0)
+                test_global_storage.Get("weight").transpose(weight_perm)
             )
             tf_out = grouped_convolution2D(
                 x, weight, padding="VALID", num_groups=groups
             )
+        if use_bias:
+            bias = tf.Variable(test_global_storage.Get("bias"))
+            tf_out = tf.nn.bias_add(tf_out, bias, data_format="NHWC")
 
-    loss_diff = test_global_storage.Get("loss_diff").transpose(0, 2, 3, 1)
+    loss_diff = to_nhwc(test_global_storage.Get("loss_diff"))
     tf_x_diff = tape.gradient(tf_out, x, loss_diff)
     tf_weight_diff = tape.gradient(tf_out, weight, loss_diff)
 
-    of_out_np = of_out.numpy().transpose(0, 2, 3, 1)
+    of_out_np = to_nhwc(of_out.numpy())
     tf_out_np = tf_out.numpy()
     max_abs_diff = np.max(np.absolute(of_out_np - tf_out_np))
     fail_info = "\nshape (of vs. tf): {} vs. {}\nmax_abs_diff: {}".format(
         of_out_np.shape, tf_out_np.shape, max_abs_diff
     )
     test_case.assertTrue(
-        np.allclose(of_out_np, tf_out_np, rtol=1e-5, atol=1e-5), fail_info
+        np.allclose(of_out_np, tf_out_np, rtol=rtol, atol=atol), fail_info
     )
 
-    of_x_diff_arr = test_global_storage.Get("x_diff").transpose(0, 2, 3, 1)
+    of_x_diff_arr = to_nhwc(test_global_storage.Get("x_diff"))
     tf_x_diff_arr = tf_x_diff.numpy()
     max_abs_diff = np.max(np.abs(of_x_diff_arr - tf_x_diff_arr))
 
     test_case.assertTrue(
-        np.allclose(of_x_diff_arr, tf_x_diff_arr, rtol=1e-5, atol=1e-4)
+        np.allclose(of_x_diff_arr, tf_x_diff_arr, rtol=rtol, atol=atol * 10)
     )
     test_case.assertTrue(
         np.allclose(
-            test_global_storage.Get("weight_diff").transpose(2, 3, 1, 0),
+            test_global_storage.Get("weight_diff").transpose(weight_perm),
             tf_weight_diff.numpy(),
-            rtol=1e-5,
-            atol=1e-5,
+            rtol=rtol,
+            atol=atol,
         )
     )
+    if use_bias:
+        tf_bias_diff = tape.gradient(tf_out, bias, loss_diff)
+        test_case.assertTrue(
+            np.allclose(
+                test_global_storage.Get("bias_diff"),
+                tf_bias_diff.numpy(),
+                rtol=rtol,
+                atol=atol,
+            )
+        )
 
 
 def test_conv1(test_case):
@@ -228,3 +286,30 @@ def test_conv6(test_case):
     arg_dict["groups"] = [32]
     for arg in GenArgList(arg_dict):
         compare_with_tensorflow(test_case, *arg)
+
+
+def test_conv_with_bias(test_case):
+    arg_dict = OrderedDict()
+    arg_dict["device_type"] = ["gpu", "cpu"]
+    arg_dict["x_shape"] = [(10, 32, 20, 20)]
+    arg_dict["filters"] = [64]
+    arg_dict["kernel_size"] = [3]
+    arg_dict["groups"] = [1]
+    arg_dict["use_bias"] = [True]
+    arg_dict["data_format"] = ["NCHW", "NHWC"]
+    for arg in GenArgList(arg_dict):
+        compare_with_tensorflow(test_case, *arg)
+
+
+def test_conv_with_bias_amp(test_case):
+    arg_dict = OrderedDict()
+    arg_dict["device_type"] = ["gpu"]
+    arg_dict["x_shape"] = [(10, 32, 20, 20)]
+    arg_dict["filters"] = [64]
+    arg_dict["kernel_size"] = [3]
+    arg_dict["groups"] = [1]
+    arg_dict["use_bias"] = [True]
+    arg_dict["data_format"] = ["NCHW", "NHWC"]
+    arg_dict["amp"] = [True]
+    for arg in GenArgList(arg_dict):
+        compare_with_tensorflow(test_case, *arg)
@@ -0,0 +1,103 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from collections import OrderedDict
+
+import numpy as np
+import oneflow as flow
+import oneflow.python.framework.session_context as session_ctx
+import test_global_storage
+from test_util import GenArgList
+
+
+def compare_dense_with_shared_weight(test_case, device_type, x_shape, units):
+    flow.clear_default_session()
+    func_config = flow.FunctionConfig()
+    func_config.default_data_type(flow.float)
+
+    @flow.global_function(type="train", function_config=func_config)
+    def DenseJob():
+        with flow.scope.placement(device_type, "0:0"):
+            x = flow.get_variable(
+                "x",
+                shape=x_shape,
+                dtype=flow.float,
+                initializer=flow.random_uniform_initializer(minval=-10, maxval=10),
+                trainable=True,
+            )
+            shared_weight = flow.get_variable(
+                "shared_weight",
+                shape=(units, x_shape[-1]),
+                dtype=flow.float,
+                initializer=flow.random_uniform_initializer(minval=-10, maxval=10),
+                trainable=True,
+            )
+            loss = flow.layers.dense(
+                x,
+                units,
+                bias_initializer=flow.random_uniform_initializer(minval=-10, maxval=10),
+                name="Dense",
+                shared_weight=shared_weight,
+            )
+            bias = flow.get_variable(
+                "Dense-bias",
+                shape=(units,),
+                dtype=flow.float,
+                initializer=flow.random_uniform_initializer(minval=-10, maxval=10),
+            )
+            flow.optimizer.SGD(
+                flow.optimizer.PiecewiseConstantScheduler([], [1e-4]), momentum=0
+            ).minimize(loss)
+
+            flow.watch(x, test_global_storage.Setter("x"))
+            flow.watch(shared_weight, test_global_storage.Setter("weight"))
+            flow.watch_diff(shared_weight, test_global_storage.Setter("weight_diff"))
+            flow.watch(bias, test_global_storage.Setter("bias"))
+            flow.watch_diff(loss, test_global_storage.Setter("loss_diff"))
+
+            return loss
+
+    check_point = flow.train.CheckPoint()
+    check_point.init()
+    of_out = DenseJob().get().numpy()
+
+    sess = session_ctx.GetDefaultSession()
+    dense_weight, _ = sess.TryGetVariableBlobOfJobFromStash("DenseJob", "Dense-weight")
+    test_case.assertIsNone(dense_weight)
+
+    x = test_global_storage.Get("x")
+    weight = test_global_storage.Get("weight")
+    bias = test_global_storage.Get("bias")
+    loss_diff = test_global_storage.Get("loss_diff")
+    np_out = np.matmul(x, weight.T) + bias
+    test_case.assertTrue(np.allclose(of_out, np_out, rtol=1e-4, atol=1e-3))
+    np_weight_diff = np.matmul(loss_diff.T, x)
+    test_case.assertTrue(
+        np.allclose(
+            test_global_storage.Get("weight_diff"),
+            np_weight_diff,
+            rtol=1e-4,
+            atol=1e-3,
+        )
+    )
+
+
+def test_dense_with_shared_weight(test_case):
+    arg_dict = OrderedDict()
+    arg_dict["device_type"] = ["gpu", "cpu"]
+    arg_dict["x_shape"] = [(32, 64)]
+    arg_dict["units"] = [128]
+    for arg in GenArgList(arg_dict):
+        compare_dense_with_shared_weight(test_case, *arg)
@@ -27,7 +27,9 @@ for gpu in gpus:
     tf.config.experimental.set_memory_growth(gpu, True)
 
 
-def compare_with_tensorflow(device_type, a_shape, b_shape, transpose_a, transpose_b):
+def compare_with_tensorflow(
+    device_type, a_shape, b_shape, transpose_a, transpose_b, use_bias=False
+):
     assert device_type in ["gpu", "cpu"]
     flow.clear_default_session()
     func_config = flow.FunctionConfig()
@@ -50,7 +52,18 @@ def compare_with_tensorflow(device_type, a_shape, b_shape, transpose_a, transpos
                 initializer=flow.random_uniform_initializer(minval=-10, maxval=10),
                 trainable=True,
             )
-            loss = flow.matmul(a, b, transpose_a, transpose_b)
+            bias = None
+            if use_bias:
+                bias = flow.get_variable(
+                    "bias",
+                    shape=(b_shape[-2] if transpose_b else b_shape[-1],),
+                    dtype=flow.float,
+                    initializer=flow.random_uniform_initializer(minval=-10, maxval=10),
+                    trainable=True,
+                )
+                flow.watch(bias, test_global_storage.Setter("bias"))
+                flow.watch_diff(bias, test_global_storage.Setter("bias_diff"))
+            loss = flow.matmul(a, b, transpose_a, transpose_b, bias=bias)
             flow.optimizer.SGD(
                 flow.optimizer.PiecewiseConstantScheduler([], [1e-4]), momentum=0
             ).minimize(loss)
@@ -73,9 +86,17 @@ def compare_with_tensorflow(device_type, a_shape, b_shape, transpose_a, transpos
         a = tf.Variable(test_global_storage.Get("a"))
         b = tf.Variable(test_global_storage.Get("b"))
         tf_out = tf.matmul(a, b, transpose_a, transpose_b)
+        if use_bias:
+            bias = tf.Variable(test_global_storage.Get("bias"))
+            tf_out = tf.nn.bias_add(tf_out, bias)
     loss_diff = test_global_storage.Get("loss_diff")
     tf_a_diff = tape.gradient(tf_out, a, loss_diff)
     tf_b_diff = tape.gradient(tf_out, b, loss_diff)
+    if use_bias:
+        tf_bias_diff = tape.gradient(tf_out, bias, loss_diff)
+        assert np.allclose(
+            test_global_storage.Get("bias_diff"), tf_bias_diff.numpy(), atol=1e-03
+        )
 
     assert np.allclose(of_out.numpy(), tf_out.numpy(), atol=1e-03), np.max(
         np.abs(of_out.numpy() - tf_out.numpy())
@@ -126,3 +147,15 @@ def gen_arg_list():
 def test_matmul(test_case):
     for arg in gen_arg_list():
         compare_with_tensorflow(*arg)
+
+
+def test_matmul_with_bias(test_case):
+    arg_dict = OrderedDict()
+    arg_dict["device_type"] = ["cpu", "gpu"]
+    arg_dict["a_shape"] = [(512, 256)]
+    arg_dict["b_shape"] = [(256, 1024), (1024, 256)]
+    arg_dict["transpose_a"] = [False]
+    arg_dict["transpose_b"] = [True, False]
+    arg_dict["use_bias"] = [True]
+    for arg in filter_args(GenArgList(arg_dict)):
+        compare_with_tensorflow(*arg)
@@ -16,6 +16,9 @@ limitations under the License.
 #include "oneflow/xrt/tensorrt/ops/op_context.h"
 #include "oneflow/xrt/tensorrt/ops/op_kernel.h"
 
+#include "oneflow/xrt/api.h"
+#include "oneflow/xrt/tensorrt/trt_helpers.h"
+
 namespace oneflow {
 namespace xrt {
 namespace tensorrt {
@@ -43,7 +46,18 @@ class MatMulOp : public TrtOpKernel {
 
     auto *layer = ctx->builder()->addMatrixMultiply(*a, op0, *b, op1);
     layer->setName(ctx->op_name().c_str());
-    ctx->SetSoleOutput(layer->getOutput(0));
+    nvinfer1::ITensor *out = layer->getOutput(0);
+    if (ctx->HasInput("bias_0")) {
+      Shape bias_shape = ctx->InputShape("bias_0");
+      std::vector<int64_t> dims = {1, bias_shape.At(0)};
+      nvinfer1::Weights bias = ctx->Weight("bias_0");
+      nvinfer1::ITensor *reshaped_bias = helpers::Reshape(ctx, bias, AsShape(dims));
+      auto *bias_layer = ctx->builder()->addElementWise(  // NOLINT
+          *out, *reshaped_bias, nvinfer1::ElementWiseOperation::kSUM);
+      bias_layer->setName((ctx->op_name() + "_bias").c_str());
+      out = bias_layer->getOutput(0);
+    }
+    ctx->SetSoleOutput(out);
   }
 };
 
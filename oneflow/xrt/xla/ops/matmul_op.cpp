@@ -43,7 +43,9 @@ class MatMulOp : public XlaOpKernel {
 
     auto lhs = transpose_a ? xla::Transpose(a, {1, 0}) : a;
     auto rhs = transpose_b ? xla::Transpose(b, {1, 0}) : b;
-    ctx->SetOutput("out_0", xla::Dot(lhs, rhs));
+    xla::XlaOp out = xla::Dot(lhs, rhs);
+    if (ctx->HasInput("bias_0")) { out = xla::Add(out, ctx->Input("bias_0"), {1}); }
+    ctx->SetOutput("out_0", out);
   }
 };
 